@@ -0,0 +1,10 @@
+"""pytest configuration for the Python tests."""
+
+
+def pytest_configure(config):
+    # pytest-xdist is optional; register its marker so serial runs without it
+    # do not warn about an unknown mark on every test
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep the marked tests on one xdist worker under --dist loadgroup",
+    )
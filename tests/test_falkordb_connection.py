@@ -2,22 +2,176 @@
 """
 Comprehensive FalkorDB Cloud Connection Test
 Tests all major operations with the FalkorDB Python library.
+
+Runs under pytest; -s prints the report as each test finishes:
+    pytest tests/test_falkordb_connection.py -s
 """
 
+import asyncio
+import io
+import logging
 import os
+import re
+import socket
 import sys
-from datetime import datetime
+import time
+from importlib.metadata import version
 from pathlib import Path
 
+import pytest
+import pytest_asyncio
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+# Load environment variables from .env when present; CI sets them directly
+env_file = project_root / '.env'
+if env_file.exists():
+    from dotenv import load_dotenv
+    load_dotenv(env_file)
+
+from falkordb.asyncio import FalkorDB as AsyncFalkorDB
+from falkordb.asyncio.query_result import QueryResult
+from falkordb.execution_plan import ExecutionPlan
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+pytestmark = [
+    pytest.mark.skipif(not os.getenv('FALKORDB_HOST'), reason="FALKORDB_HOST is not set"),
+    # the client is bound to one event loop, so every test shares the session loop
+    pytest.mark.asyncio(loop_scope="session"),
+]
+
+# Keep idle RESP sockets alive between tests instead of reconnecting
+# (TCP + AUTH); options missing on this platform are left at OS defaults
+KEEPALIVE_OPTIONS = {
+    option: value
+    for option, value in (
+        (getattr(socket, 'TCP_KEEPIDLE', None), 30),
+        (getattr(socket, 'TCP_KEEPINTVL', None), 10),
+        (getattr(socket, 'TCP_KEEPCNT', None), 3),
+    )
+    if option is not None
+}
+
+# Upper bound on pooled connections shared by concurrently awaited queries
+MAX_CONNECTIONS = 16
+
+# Fail fast on an unreachable host instead of waiting out the OS connect timeout
+CONNECT_TIMEOUT = 2
+COMMAND_TIMEOUT = 10
+
+# EXPLAIN plans by (graph, normalized query, parameter header); the suite
+# explains only a few distinct queries, so entries are never evicted
+_explain_plans = {}
+
+# Cypher used by the tests; parameters are passed separately so the query
+# text stays identical between runs
+_Q_CREATE_PERSON_INDEX = "CREATE INDEX FOR (p:Person) ON (p.name)"
+_Q_CREATE_PROJECT_INDEX = "CREATE INDEX FOR (pr:Project) ON (pr.name)"
+_Q_CREATE_TECHNOLOGY_INDEX = "CREATE INDEX FOR (t:Technology) ON (t.name)"
+
+_Q_CREATE_PEOPLE = """
+    UNWIND $rows AS r
+    CREATE (:Person {name: r.name, age: r.age, role: r.role})
+"""
+
+_Q_CREATE_PROJECTS = """
+    UNWIND $rows AS r
+    CREATE (:Project {name: r.name, status: r.status, year: r.year})
+"""
+
+_Q_CREATE_TECHNOLOGIES = """
+    UNWIND $rows AS r
+    CREATE (:Technology {name: r.name, type: r.type})
+"""
+
+_Q_CREATE_WORKS_ON = """
+    UNWIND $rels AS r
+    MATCH (a:Person {name: r.from}), (b:Project {name: r.to})
+    CREATE (a)-[:WORKS_ON {since: r.since, role: r.role}]->(b)
+"""
+
+_Q_CREATE_MANAGES = """
+    UNWIND $rels AS r
+    MATCH (a:Person {name: r.from}), (b:Project {name: r.to})
+    CREATE (a)-[:MANAGES {since: r.since}]->(b)
+"""
+
+_Q_CREATE_KNOWS = """
+    UNWIND $rels AS r
+    MATCH (a:Person {name: r.from}), (b:Person {name: r.to})
+    CREATE (a)-[:KNOWS {since: r.since}]->(b)
+"""
+
+_Q_CREATE_USES = """
+    UNWIND $rels AS r
+    MATCH (a:Project {name: r.from}), (b:Technology {name: r.to})
+    CREATE (a)-[:USES {version: r.version}]->(b)
+"""
+
+_Q_ALL_NODES = "MATCH (n) RETURN n LIMIT 10"
 
-from falkordb import FalkorDB
+_Q_PEOPLE_OLDER_THAN = """
+    MATCH (p:Person)
+    WHERE p.age > $min_age
+    RETURN p.name, p.age, p.role
+    ORDER BY p.age DESC
+"""
+
+# Queried, explained and profiled with the same text so all three share
+# one plan-cache entry
+_Q_WORKS_ON = """
+    MATCH (p:Person)-[r:WORKS_ON]->(proj:Project)
+    RETURN p.name, r.role, proj.name
+"""
+
+# Project the role first so only the string, not the node, reaches Aggregate
+_Q_COUNT_BY_ROLE = """
+    MATCH (p:Person)
+    WITH p.role AS role
+    RETURN role, count(role) AS count
+    ORDER BY count DESC
+"""
+
+_Q_PERSON_BY_NAME = "MATCH (p:Person {name: $name}) RETURN p"
+_Q_LIST_INDEXES = "CALL db.indexes()"
+# Labels, relationship types and property keys in one reply, tagged by kind
+_Q_SCHEMA = """
+    CALL db.labels() YIELD label
+    RETURN 'label' AS k, label AS v
+    UNION ALL
+    CALL db.relationshipTypes() YIELD relationshipType
+    RETURN 'rel' AS k, relationshipType AS v
+    UNION ALL
+    CALL db.propertyKeys() YIELD propertyKey
+    RETURN 'prop' AS k, propertyKey AS v
+"""
+
+_Q_PEOPLE_BY_AGE = """
+    MATCH (p:Person)
+    RETURN p.name, p.age
+    ORDER BY p.age
+"""
+
+_Q_PATHS_TO_TECHNOLOGY = """
+    MATCH path = (alice:Person {name: $name})-[*]->(tech:Technology)
+    RETURN path
+    LIMIT 5
+"""
+
+_Q_UPDATE_PERSON = """
+    MATCH (alice:Person {name: $name})
+    SET alice.level = $level, alice.skills = $skills
+    RETURN alice
+"""
+
+_Q_DELETE_PERSON = """
+    MATCH (charlie:Person {name: $name})
+    DETACH DELETE charlie
+"""
 
 # Colors for terminal output
 class Colors:
@@ -28,328 +182,533 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-def print_test(name):
-    print(f"\n{Colors.BLUE}{Colors.BOLD}Testing: {name}{Colors.END}")
-
-def print_success(msg):
-    print(f"{Colors.GREEN}✓ {msg}{Colors.END}")
-
-def print_error(msg):
-    print(f"{Colors.RED}✗ {msg}{Colors.END}")
-
-def print_info(msg):
-    print(f"{Colors.YELLOW}ℹ {msg}{Colors.END}")
-
-def main():
-    print(f"{Colors.BOLD}{'='*60}{Colors.END}")
-    print(f"{Colors.BOLD}FalkorDB Cloud Connection Test Suite{Colors.END}")
-    print(f"{Colors.BOLD}{'='*60}{Colors.END}")
-
-    # Get connection details from environment
-    host = os.getenv('FALKORDB_HOST')
-    port = int(os.getenv('FALKORDB_PORT', '55878'))
-    username = os.getenv('FALKORDB_USER')
-    password = os.getenv('FALKORDB_PASSWORD')
-
-    print_info(f"Host: {host}")
-    print_info(f"Port: {port}")
-    print_info(f"Username: {username}")
-    print_info(f"Connection protocol: Redis RESP")
-
-    # Test 1: Basic Connection
-    print_test("1. Basic Connection & Authentication")
+class ColorFormatter(logging.Formatter):
+    """Prefix each record with its marker, colored only when stdout is a terminal."""
+
+    # logger name -> (leading text, color, marker)
+    STYLES = {
+        'falkordb_test.test': ('\n', Colors.BLUE + Colors.BOLD, 'Testing: '),
+        'falkordb_test.success': ('', Colors.GREEN, '✓ '),
+        'falkordb_test.info': ('', Colors.YELLOW, 'ℹ '),
+        'falkordb_test.error': ('', Colors.RED, '✗ '),
+        'falkordb_test.rule': ('', Colors.BOLD, ''),
+    }
+
+    def __init__(self):
+        super().__init__('%(message)s')
+        tty = sys.stdout.isatty()
+        self._prefixes = {
+            name: f"{lead}{color}{marker}" if tty else f"{lead}{marker}"
+            for name, (lead, color, marker) in self.STYLES.items()
+        }
+        self._suffix = Colors.END if tty else ''
+
+    def format(self, record):
+        return f"{self._prefixes.get(record.name, '')}{super().format(record)}{self._suffix}"
+
+# Output is collected here and written to stdout once per test
+_out = io.StringIO()
+
+_handler = logging.StreamHandler(_out)
+_handler.setFormatter(ColorFormatter())
+
+def report_logger(name):
+    """Return a logger that writes only to _out.
+
+    It is built directly instead of through logging.getLogger(), which keeps
+    it out of the logging registry: pytest attaches its log capture to every
+    registered logger that does not propagate, and a failing test would then
+    show its report twice.
+    """
+    log = logging.Logger(name, logging.INFO)
+    log.addHandler(_handler)
+    return log
+
+logger = report_logger('falkordb_test')
+
+# Messages take %-style arguments, interpolated only when a record is emitted
+print_test = report_logger('falkordb_test.test').info
+print_success = report_logger('falkordb_test.success').info
+print_info = report_logger('falkordb_test.info').info
+print_error = report_logger('falkordb_test.error').error
+print_rule = report_logger('falkordb_test.rule').info
+
+def flush_output():
+    sys.stdout.write(_out.getvalue())
+    sys.stdout.flush()
+    _out.seek(0)
+    _out.truncate(0)
+
+def print_final_summary(failed, host, port):
+    """Report the overall outcome and the connection details."""
+    print_rule("\n%s", "=" * 60)
+    if failed:
+        print_error("%s test(s) failed; see the report above", failed)
+    else:
+        print_success("All Tests Passed!")
+    print_rule("%s", "=" * 60)
+    if not failed:
+        print_info("FalkorDB Cloud connection is fully functional via Redis protocol")
+    print_info("Connection details:")
+    print_info("  - Protocol: Redis RESP")
+    print_info("  - Host: %s", host)
+    print_info("  - Port: %s", port)
+    print_info("  - Library: falkordb-py %s", version('falkordb'))
+
+def connection_settings():
+    """Read host, port, username and password from the environment."""
+    return (
+        os.getenv('FALKORDB_HOST'),
+        int(os.getenv('FALKORDB_PORT', '55878')),
+        os.getenv('FALKORDB_USER'),
+        os.getenv('FALKORDB_PASSWORD'),
+    )
+
+def connect(host, port, username, password):
+    """Create the FalkorDB client shared by every test in the session."""
+    return AsyncFalkorDB(
+        host=host,
+        port=port,
+        username=username,
+        password=password,
+        socket_keepalive=True,
+        socket_keepalive_options=KEEPALIVE_OPTIONS,
+        max_connections=MAX_CONNECTIONS,
+        socket_connect_timeout=CONNECT_TIMEOUT,
+        socket_timeout=COMMAND_TIMEOUT
+    )
+
+def normalize_cypher(cypher):
+    """Collapse whitespace so reformatted copies of a query share one cache key."""
+    return re.sub(r'\s+', ' ', cypher).strip()
+
+async def cached_explain(graph, cypher, params=None):
+    """graph.explain() that reuses the plan when the same query is explained again."""
+    query = normalize_cypher(cypher)
+    key = (graph.name, query, graph._build_params_header(params))
+    if key not in _explain_plans:
+        _explain_plans[key] = await graph.explain(query, params=params)
+    return _explain_plans[key]
+
+class CompactReply:
+    """Undecoded --compact reply; rows are only materialized by decode().
+
+    redis-py reads each pipelined reply whole before returning it, so the
+    rows cannot be streamed; deferring decode() is the only saving there is.
+    """
+
+    def __init__(self, graph, response):
+        # run-time errors arrive as the last element of the reply
+        if isinstance(response[-1], ResponseError):
+            raise response[-1]
+        self._graph = graph
+        self._response = response
+
+    @property
+    def row_count(self):
+        # [header, rows, stats] when the query returns data, [stats] otherwise
+        return len(self._response[1]) if len(self._response) == 3 else 0
+
+    @property
+    def run_time_ms(self):
+        for stat in self._response[-1]:
+            name, _, value = stat.partition(': ')
+            if name == 'Query internal execution time':
+                return float(value.split()[0])
+        return 0.0
+
+    async def decode(self):
+        result = QueryResult(self._graph)
+        await result.parse(self._response)
+        return result
+
+async def pipelined(db, graph, commands, decode=True):
+    """Send (command, query[, params]) tuples back-to-back on one pipeline.
+
+    Replies are decoded into QueryResults unless decode is False, in which
+    case the CompactReply wrappers are returned as-is.
+    """
+    pipe = db.connection.pipeline(transaction=False)
+    for command, query, *params in commands:
+        if params:
+            # the client's own header builder, so keys are quoted and
+            # validated exactly as graph.query() does it
+            query = graph._build_params_header(params[0]) + query
+        pipe.execute_command(command, graph.name, query, '--compact')
+    replies = [CompactReply(graph, response) for response in await pipe.execute()]
+    if not decode:
+        return replies
+    return [await reply.decode() for reply in replies]
+
+async def explain_and_profile(db, graph, query):
+    """EXPLAIN and PROFILE one query back-to-back; return both ExecutionPlans."""
+    pipe = db.connection.pipeline(transaction=False)
+    pipe.execute_command('GRAPH.EXPLAIN', graph.name, query)
+    pipe.execute_command('GRAPH.PROFILE', graph.name, query)
+    return [ExecutionPlan(reply) for reply in await pipe.execute()]
+
+@pytest.fixture(autouse=True)
+def flush_after_test():
+    yield
+    flush_output()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def falkordb(request):
+    """Yield (db, graph_name, graph) and drop the graph if a test left it behind.
+
+    The final summary is printed at teardown, so it appears whichever tests
+    failed or were skipped.
+    """
+    host, port, username, password = connection_settings()
+    # The client probes the server while it is constructed and a cheap PING
+    # then warms the pooled connection; if either fails, the error is cached
+    # with this fixture and every test errors out without reconnecting
     try:
-        db = FalkorDB(
-            host=host,
-            port=port,
-            username=username,
-            password=password
-        )
-        print_success("Connection established successfully")
-    except Exception as e:
-        print_error(f"Connection failed: {e}")
-        return 1
-
-    # Test 2: List Existing Graphs
+        db = connect(host, port, username, password)
+        await db.connection.ping()
+    except (RedisConnectionError, RedisTimeoutError) as e:
+        pytest.fail(f"Cannot reach FalkorDB at {host}:{port}: {e}", pytrace=False)
+    # Each xdist worker runs its own session and therefore gets its own graph
+    worker = os.getenv('PYTEST_XDIST_WORKER', 'master')
+    graph_name = f"graphmind_connection_test_{time.time_ns()}_{worker}"
+    graph = db.select_graph(graph_name)
+    # Resizing the server plan cache (FalkorDB defaults to 25 per thread)
+    # changes server-wide config, so it is opt-in and undone at teardown
+    plan_cache_size = os.getenv('FALKORDB_PLAN_CACHE_SIZE')
+    previous_cache_size = None
+    if plan_cache_size:
+        current = await db.config_get('CACHE_SIZE')
+        try:
+            await db.config_set('CACHE_SIZE', int(plan_cache_size))
+            previous_cache_size = current
+        except ResponseError as e:
+            # Most deployments only accept CACHE_SIZE as a module load argument
+            print_info("Plan cache size left at %s: %s", current, e)
+    # Write setup messages now so they are not reported under the first test
+    flush_output()
+    yield db, graph_name, graph
+    if graph_name in await db.list_graphs():
+        await graph.delete()
+    if previous_cache_size is not None:
+        await db.config_set('CACHE_SIZE', previous_cache_size)
+    await db.connection.aclose()
+    print_final_summary(request.session.testsfailed, host, port)
+    flush_output()
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def indexes(falkordb):
+    """Create the name indexes and list them back; return (created, listed).
+
+    Queries on one graph run in order, so CALL db.indexes() in the same
+    pipeline already sees the indexes created ahead of it.
+    """
+    # Index the lookup keys before the bulk load so the MATCH clauses of
+    # bulk_data find their endpoints with index scans instead of label scans
+    db, _, graph = falkordb
+    *created, listed = await pipelined(db, graph, [
+        ('GRAPH.QUERY', _Q_CREATE_PERSON_INDEX),
+        ('GRAPH.QUERY', _Q_CREATE_PROJECT_INDEX),
+        ('GRAPH.QUERY', _Q_CREATE_TECHNOLOGY_INDEX),
+        ('GRAPH.QUERY', _Q_LIST_INDEXES),
+    ])
+    return created, listed
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def bulk_data(falkordb, indexes):
+    """Create the test nodes and relationships once; return both write results."""
+    db, _, graph = falkordb
+    # Labels and relationship types cannot be parameterized, so each gets its
+    # own UNWIND statement; all of them share one pipelined round-trip, which
+    # the server runs in order so the nodes exist before they are matched
+    results = await pipelined(db, graph, [
+        ('GRAPH.QUERY', _Q_CREATE_PEOPLE, {'rows': [
+            {'name': 'Alice', 'age': 30, 'role': 'Engineer'},
+            {'name': 'Bob', 'age': 25, 'role': 'Designer'},
+            {'name': 'Charlie', 'age': 35, 'role': 'Manager'},
+        ]}),
+        ('GRAPH.QUERY', _Q_CREATE_PROJECTS, {'rows': [
+            {'name': 'GraphMind', 'status': 'active', 'year': 2025},
+        ]}),
+        ('GRAPH.QUERY', _Q_CREATE_TECHNOLOGIES, {'rows': [
+            {'name': 'FalkorDB', 'type': 'Graph Database'},
+        ]}),
+        ('GRAPH.QUERY', _Q_CREATE_WORKS_ON, {'rels': [
+            {'from': 'Alice', 'to': 'GraphMind', 'since': 2025, 'role': 'Lead Developer'},
+            {'from': 'Bob', 'to': 'GraphMind', 'since': 2025, 'role': 'UI Designer'},
+        ]}),
+        ('GRAPH.QUERY', _Q_CREATE_MANAGES, {'rels': [
+            {'from': 'Charlie', 'to': 'GraphMind', 'since': 2025},
+        ]}),
+        ('GRAPH.QUERY', _Q_CREATE_KNOWS, {'rels': [
+            {'from': 'Alice', 'to': 'Bob', 'since': 2024},
+        ]}),
+        ('GRAPH.QUERY', _Q_CREATE_USES, {'rels': [
+            {'from': 'GraphMind', 'to': 'FalkorDB', 'version': '1.2.0'},
+        ]}),
+    ])
+    return results[:3], results[3:]
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def read_only(falkordb, bulk_data):
+    """Run every read-only query against the freshly loaded data in one go.
+
+    The result-set queries share one pipeline while EXPLAIN and PROFILE
+    (which reply with plans) are awaited concurrently alongside it.  The
+    tests that mutate the graph request this fixture as well, so the reads
+    are always captured before any of them runs.
+    """
+    db, _, graph = falkordb
+    replies, index_plan, (plan, profile) = await asyncio.gather(
+        pipelined(db, graph, [
+            ('GRAPH.QUERY', _Q_ALL_NODES),
+            ('GRAPH.QUERY', _Q_PEOPLE_OLDER_THAN, {'min_age': 27}),
+            ('GRAPH.QUERY', _Q_WORKS_ON),
+            ('GRAPH.QUERY', _Q_COUNT_BY_ROLE),
+            ('GRAPH.QUERY', _Q_SCHEMA),
+            ('GRAPH.RO_QUERY', _Q_PEOPLE_BY_AGE),
+            ('GRAPH.QUERY', _Q_PATHS_TO_TECHNOLOGY, {'name': 'Alice'}),
+        ], decode=False),
+        cached_explain(graph, _Q_PERSON_BY_NAME, params={'name': 'Alice'}),
+        explain_and_profile(db, graph, _Q_WORKS_ON),
+    )
+    # Tests 15 and 16 only report counts and timings, so those replies are
+    # not decoded up front
+    *row_replies, ro_reply, paths_reply = replies
+    (nodes_result, filter_result, works_on_result, roles_result,
+     schema_result) = [await reply.decode() for reply in row_replies]
+    return {
+        'nodes': nodes_result,
+        'filter': filter_result,
+        'works_on': works_on_result,
+        'roles': roles_result,
+        'index_plan': index_plan,
+        'schema': schema_result,
+        'plan': plan,
+        'profile': profile,
+        'ro': ro_reply,
+        'paths': paths_reply,
+    }
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def cleanup(falkordb, read_only):
+    """Delete the test graph and list the remaining graphs in one round-trip.
+
+    Only Test 19 instantiates this, so it runs after the other writes.
+    """
+    db, graph_name, _ = falkordb
+    pipe = db.connection.pipeline(transaction=False)
+    pipe.execute_command('GRAPH.DELETE', graph_name)
+    pipe.execute_command('GRAPH.LIST')
+    deleted, graphs = await pipe.execute()
+    return deleted, graphs
+
+# Tests 1-3 share the writes group so that, under the optional xdist run,
+# they do not land on a third worker that would create a graph of its own
+@pytest.mark.xdist_group("writes")
+async def test_01_connection(falkordb):
+    host, port, username, _ = connection_settings()
+    print_test("1. Basic Connection & Authentication")
+    print_info("Host: %s", host)
+    print_info("Port: %s", port)
+    print_info("Username: %s", username)
+    print_info("Connection protocol: Redis RESP")
+    db, _, _ = falkordb
+    assert await db.connection.ping() is True
+    print_success("Connection established successfully")
+
+@pytest.mark.xdist_group("writes")
+async def test_02_list_graphs(falkordb):
     print_test("2. List Existing Graphs")
-    try:
-        graphs = db.list_graphs()
-        print_success(f"Found {len(graphs)} existing graphs: {graphs}")
-    except Exception as e:
-        print_error(f"Failed to list graphs: {e}")
-        return 1
-
-    # Test 3: Create Test Graph
-    graph_name = f"graphmind_connection_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    print_test(f"3. Create Test Graph: {graph_name}")
-    try:
-        graph = db.select_graph(graph_name)
-        print_success(f"Graph '{graph_name}' selected/created")
-    except Exception as e:
-        print_error(f"Failed to create graph: {e}")
-        return 1
-
-    # Test 4: Create Nodes
+    db, _, _ = falkordb
+    graphs = await db.list_graphs()
+    assert isinstance(graphs, list)
+    print_success("Found %s existing graphs: %s", len(graphs), graphs)
+
+@pytest.mark.xdist_group("writes")
+async def test_03_create_graph(falkordb, indexes):
+    _, graph_name, _ = falkordb
+    print_test("3. Create Test Graph & Indexes: %s", graph_name)
+    print_success("Graph '%s' selected/created", graph_name)
+    created, _ = indexes
+    indices_created = sum(r.indices_created for r in created)
+    assert indices_created == 3
+    print_success("Indexes created - Indices created: %s", indices_created)
+    print_info("Execution time: %.3fms", sum(r.run_time_ms for r in created))
+
+@pytest.mark.xdist_group("writes")
+# Explicit names: loadgroup appends "@writes" to node ids, which
+# pytest-dependency would otherwise use as the dependency key
+@pytest.mark.dependency(name="test_04_create_nodes")
+async def test_04_create_nodes(bulk_data):
     print_test("4. Create Nodes")
-    try:
-        result = graph.query("""
-            CREATE
-                (alice:Person {name: 'Alice', age: 30, role: 'Engineer'}),
-                (bob:Person {name: 'Bob', age: 25, role: 'Designer'}),
-                (charlie:Person {name: 'Charlie', age: 35, role: 'Manager'}),
-                (graphmind:Project {name: 'GraphMind', status: 'active', year: 2025}),
-                (falkordb:Technology {name: 'FalkorDB', type: 'Graph Database'})
-            RETURN alice, bob, charlie, graphmind, falkordb
-        """)
-        print_success(f"Created nodes - Labels added: {result.labels_added}, Nodes created: {result.nodes_created}, Properties set: {result.properties_set}")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to create nodes: {e}")
-        return 1
-
-    # Test 5: Create Relationships
+    results, _ = bulk_data
+    labels_added = sum(r.labels_added for r in results)
+    nodes_created = sum(r.nodes_created for r in results)
+    properties_set = sum(r.properties_set for r in results)
+    assert nodes_created == 5
+    print_success("Created nodes - Labels added: %s, Nodes created: %s, Properties set: %s", labels_added, nodes_created, properties_set)
+    print_info("Execution time: %.3fms", sum(r.run_time_ms for r in results))
+
+@pytest.mark.xdist_group("writes")
+@pytest.mark.dependency(depends=["test_04_create_nodes"])
+async def test_05_create_relationships(bulk_data):
     print_test("5. Create Relationships")
-    try:
-        result = graph.query("""
-            MATCH
-                (alice:Person {name: 'Alice'}),
-                (bob:Person {name: 'Bob'}),
-                (charlie:Person {name: 'Charlie'}),
-                (project:Project {name: 'GraphMind'}),
-                (tech:Technology {name: 'FalkorDB'})
-            CREATE
-                (alice)-[:WORKS_ON {since: 2025, role: 'Lead Developer'}]->(project),
-                (bob)-[:WORKS_ON {since: 2025, role: 'UI Designer'}]->(project),
-                (charlie)-[:MANAGES {since: 2025}]->(project),
-                (alice)-[:KNOWS {since: 2024}]->(bob),
-                (project)-[:USES {version: '1.2.0'}]->(tech)
-            RETURN alice, bob, charlie, project, tech
-        """)
-        print_success(f"Created relationships - Relationships created: {result.relationships_created}, Properties set: {result.properties_set}")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to create relationships: {e}")
-        return 1
-
-    # Test 6: Query All Nodes
+    _, results = bulk_data
+    relationships_created = sum(r.relationships_created for r in results)
+    properties_set = sum(r.properties_set for r in results)
+    assert relationships_created == 5
+    print_success("Created relationships - Relationships created: %s, Properties set: %s", relationships_created, properties_set)
+    print_info("Execution time: %.3fms", sum(r.run_time_ms for r in results))
+
+@pytest.mark.xdist_group("readonly")
+async def test_06_query_all_nodes(read_only):
     print_test("6. Query All Nodes")
-    try:
-        result = graph.query("MATCH (n) RETURN n LIMIT 10")
-        print_success(f"Retrieved {len(result.result_set)} nodes")
-        for row in result.result_set:
-            node = row[0]
-            print_info(f"  - {node}")
-    except Exception as e:
-        print_error(f"Failed to query nodes: {e}")
-        return 1
-
-    # Test 7: Query with Filtering
+    result = read_only['nodes']
+    assert len(result.result_set) == 5
+    print_success("Retrieved %s nodes", len(result.result_set))
+    _pi = print_info
+    for row in result.result_set:
+        node = row[0]
+        _pi("  - %s", node)
+
+@pytest.mark.xdist_group("readonly")
+async def test_07_query_with_filtering(read_only):
     print_test("7. Query with Filtering (People over 27)")
-    try:
-        result = graph.query("""
-            MATCH (p:Person)
-            WHERE p.age > 27
-            RETURN p.name, p.age, p.role
-            ORDER BY p.age DESC
-        """)
-        print_success(f"Found {len(result.result_set)} people over 27")
-        for row in result.result_set:
-            print_info(f"  - {row[0]}, age {row[1]}, {row[2]}")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to query with filtering: {e}")
-        return 1
-
-    # Test 8: Query Relationships
+    result = read_only['filter']
+    assert [row[0] for row in result.result_set] == ['Charlie', 'Alice']
+    print_success("Found %s people over 27", len(result.result_set))
+    _pi = print_info
+    for row in result.result_set:
+        _pi("  - %s, age %s, %s", *row)
+    print_info("Execution time: %.3fms", result.run_time_ms)
+
+@pytest.mark.xdist_group("readonly")
+async def test_08_query_relationships(read_only):
     print_test("8. Query Relationships (Who works on what)")
-    try:
-        result = graph.query("""
-            MATCH (p:Person)-[r:WORKS_ON]->(proj:Project)
-            RETURN p.name, r.role, proj.name
-        """)
-        print_success(f"Found {len(result.result_set)} work relationships")
-        for row in result.result_set:
-            print_info(f"  - {row[0]} works on {row[2]} as {row[1]}")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to query relationships: {e}")
-        return 1
-
-    # Test 9: Aggregation Query
+    result = read_only['works_on']
+    assert len(result.result_set) == 2
+    print_success("Found %s work relationships", len(result.result_set))
+    _pi = print_info
+    for row in result.result_set:
+        _pi("  - %s works on %s as %s", row[0], row[2], row[1])
+    print_info("Execution time: %.3fms", result.run_time_ms)
+
+@pytest.mark.xdist_group("readonly")
+async def test_09_aggregation(read_only):
     print_test("9. Aggregation Query (Count people by role)")
-    try:
-        result = graph.query("""
-            MATCH (p:Person)
-            RETURN p.role as role, COUNT(p) as count
-            ORDER BY count DESC
-        """)
-        print_success(f"Found {len(result.result_set)} roles")
-        for row in result.result_set:
-            print_info(f"  - {row[0]}: {row[1]} people")
-    except Exception as e:
-        print_error(f"Failed to run aggregation: {e}")
-        return 1
-
-    # Test 10: Create Index
-    print_test("10. Create Index on Person.name")
-    try:
-        result = graph.query("CREATE INDEX FOR (p:Person) ON (p.name)")
-        print_success(f"Index created - Indices created: {result.indices_created}")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to create index: {e}")
-        return 1
-
-    # Test 11: List Indexes
+    result = read_only['roles']
+    assert len(result.result_set) == 3
+    print_success("Found %s roles", len(result.result_set))
+    _pi = print_info
+    for row in result.result_set:
+        _pi("  - %s: %s people", *row)
+
+@pytest.mark.xdist_group("readonly")
+async def test_10_index_usage(read_only):
+    print_test("10. Verify Index Usage on Person.name")
+    index_plan = read_only['index_plan']
+    assert 'Node By Index Scan' in str(index_plan), f"Lookup by name does not use the index:\n{index_plan}"
+    print_success("Lookup by name is planned as Node By Index Scan")
+
+@pytest.mark.xdist_group("readonly")
+async def test_11_list_indexes(indexes):
     print_test("11. List All Indexes")
-    try:
-        result = graph.query("CALL db.indexes()")
-        print_success(f"Found {len(result.result_set)} indexes")
-        for row in result.result_set:
-            if row[0]:  # label
-                print_info(f"  - Label: {row[0]}, Properties: {row[1]}, Status: {row[7]}")
-    except Exception as e:
-        print_error(f"Failed to list indexes: {e}")
-        return 1
-
-    # Test 12: Get Graph Schema
+    _, result = indexes
+    assert len(result.result_set) == 3
+    print_success("Found %s indexes", len(result.result_set))
+    _pi = print_info
+    for row in result.result_set:
+        if row[0]:  # label
+            _pi("  - Label: %s, Properties: %s, Status: %s", row[0], row[1], row[7])
+
+@pytest.mark.xdist_group("readonly")
+async def test_12_graph_schema(read_only):
     print_test("12. Get Graph Schema")
-    try:
-        # Get labels
-        labels_result = graph.query("CALL db.labels()")
-        labels = [row[0] for row in labels_result.result_set]
-        print_success(f"Labels: {labels}")
-
-        # Get relationship types
-        rels_result = graph.query("CALL db.relationshipTypes()")
-        rels = [row[0] for row in rels_result.result_set]
-        print_success(f"Relationship types: {rels}")
-
-        # Get property keys
-        props_result = graph.query("CALL db.propertyKeys()")
-        props = [row[0] for row in props_result.result_set]
-        print_success(f"Property keys: {props}")
-    except Exception as e:
-        print_error(f"Failed to get schema: {e}")
-        return 1
-
-    # Test 13: Explain Query
+    schema = {'label': [], 'rel': [], 'prop': []}
+    for kind, value in read_only['schema'].result_set:
+        schema[kind].append(value)
+    labels = schema['label']
+    assert sorted(labels) == ['Person', 'Project', 'Technology']
+    print_success("Labels: %s", labels)
+    rels = schema['rel']
+    assert sorted(rels) == ['KNOWS', 'MANAGES', 'USES', 'WORKS_ON']
+    print_success("Relationship types: %s", rels)
+    props = schema['prop']
+    print_success("Property keys: %s", props)
+
+@pytest.mark.xdist_group("readonly")
+async def test_13_explain(read_only):
     print_test("13. Explain Query Execution Plan")
-    try:
-        result = graph.explain("""
-            MATCH (p:Person)-[r:WORKS_ON]->(proj:Project)
-            WHERE p.age > 25
-            RETURN p.name, proj.name
-        """)
-        print_success("Query execution plan:")
-        for line in result:
-            print_info(f"  {line}")
-    except Exception as e:
-        print_error(f"Failed to explain query: {e}")
-        return 1
-
-    # Test 14: Profile Query
+    plan = read_only['plan']
+    assert list(plan)
+    print_success("Query execution plan:")
+    _pi = print_info
+    for line in plan:
+        _pi("  %s", line)
+
+@pytest.mark.xdist_group("readonly")
+async def test_14_profile(read_only):
     print_test("14. Profile Query Performance")
-    try:
-        result = graph.profile("""
-            MATCH (p:Person)-[r:WORKS_ON]->(proj:Project)
-            RETURN p.name, r.role, proj.name
-        """)
-        print_success("Query profile:")
-        for line in result:
-            print_info(f"  {line}")
-    except Exception as e:
-        print_error(f"Failed to profile query: {e}")
-        return 1
-
-    # Test 15: Read-Only Query
+    profile = read_only['profile']
+    assert list(profile)
+    print_success("Query profile:")
+    _pi = print_info
+    for line in profile:
+        _pi("  %s", line)
+
+@pytest.mark.xdist_group("readonly")
+async def test_15_read_only_query(read_only):
     print_test("15. Read-Only Query")
-    try:
-        result = graph.ro_query("""
-            MATCH (p:Person)
-            RETURN p.name, p.age
-            ORDER BY p.age
-        """)
-        print_success(f"Read-only query returned {len(result.result_set)} rows")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to run read-only query: {e}")
-        return 1
-
-    # Test 16: Path Finding
+    ro_reply = read_only['ro']
+    assert ro_reply.row_count == 3
+    print_success("Read-only query returned %s rows", ro_reply.row_count)
+    print_info("Execution time: %.3fms", ro_reply.run_time_ms)
+
+@pytest.mark.xdist_group("readonly")
+async def test_16_path_finding(read_only):
     print_test("16. Path Finding (Find paths between Alice and technology)")
-    try:
-        result = graph.query("""
-            MATCH path = (alice:Person {name: 'Alice'})-[*]->(tech:Technology)
-            RETURN path
-            LIMIT 5
-        """)
-        print_success(f"Found {len(result.result_set)} paths")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to find paths: {e}")
-        return 1
-
-    # Test 17: Update Node Properties
+    paths_reply = read_only['paths']
+    assert paths_reply.row_count == 2
+    print_success("Found %s paths", paths_reply.row_count)
+    print_info("Execution time: %.3fms", paths_reply.run_time_ms)
+
+@pytest.mark.xdist_group("writes")
+@pytest.mark.dependency(depends=["test_04_create_nodes"])
+async def test_17_update_properties(falkordb, read_only):
     print_test("17. Update Node Properties")
-    try:
-        result = graph.query("""
-            MATCH (alice:Person {name: 'Alice'})
-            SET alice.level = 'Senior', alice.skills = ['Python', 'GraphDB', 'AI']
-            RETURN alice
-        """)
-        print_success(f"Updated properties - Properties set: {result.properties_set}")
-        print_info(f"Execution time: {result.run_time_ms:.3f}ms")
-    except Exception as e:
-        print_error(f"Failed to update properties: {e}")
-        return 1
-
-    # Test 18: Delete Specific Nodes
+    _, _, graph = falkordb
+    result = await graph.query(_Q_UPDATE_PERSON, params={'name': 'Alice', 'level': 'Senior', 'skills': ['Python', 'GraphDB', 'AI']})
+    assert result.properties_set == 2
+    print_success("Updated properties - Properties set: %s", result.properties_set)
+    print_info("Execution time: %.3fms", result.run_time_ms)
+
+@pytest.mark.xdist_group("writes")
+@pytest.mark.dependency(depends=["test_04_create_nodes"])
+async def test_18_delete_node(falkordb, read_only):
     print_test("18. Delete Specific Node")
-    try:
-        result = graph.query("""
-            MATCH (charlie:Person {name: 'Charlie'})
-            DETACH DELETE charlie
-        """)
-        print_success(f"Deleted node - Nodes deleted: {result.nodes_deleted}, Relationships deleted: {result.relationships_deleted}")
-    except Exception as e:
-        print_error(f"Failed to delete node: {e}")
-        return 1
-
-    # Test 19: Cleanup - Delete Test Graph
+    _, _, graph = falkordb
+    result = await graph.query(_Q_DELETE_PERSON, params={'name': 'Charlie'})
+    assert result.nodes_deleted == 1
+    print_success("Deleted node - Nodes deleted: %s, Relationships deleted: %s", result.nodes_deleted, result.relationships_deleted)
+
+@pytest.mark.xdist_group("writes")
+@pytest.mark.dependency(name="test_19_cleanup")
+async def test_19_cleanup(falkordb, cleanup):
     print_test("19. Cleanup - Delete Test Graph")
-    try:
-        # Use Redis command directly
-        result = db.connection.execute_command('GRAPH.DELETE', graph_name)
-        print_success(f"Test graph '{graph_name}' deleted successfully: {result}")
-    except Exception as e:
-        print_error(f"Failed to delete test graph: {e}")
-        return 1
-
-    # Test 20: Verify Cleanup
+    _, graph_name, _ = falkordb
+    result, _ = cleanup
+    assert result == 'OK'
+    print_success("Test graph '%s' deleted successfully: %s", graph_name, result)
+
+@pytest.mark.xdist_group("writes")
+@pytest.mark.dependency(depends=["test_19_cleanup"])
+async def test_20_verify_cleanup(falkordb, cleanup):
     print_test("20. Verify Cleanup")
-    try:
-        graphs_after = db.list_graphs()
-        if graph_name not in graphs_after:
-            print_success(f"Graph successfully removed. Current graphs: {graphs_after}")
-        else:
-            print_error("Graph still exists after deletion")
-    except Exception as e:
-        print_error(f"Failed to verify cleanup: {e}")
-        return 1
-
-    # Final Summary
-    print(f"\n{Colors.BOLD}{'='*60}{Colors.END}")
-    print(f"{Colors.GREEN}{Colors.BOLD}✓ All Tests Passed!{Colors.END}")
-    print(f"{Colors.BOLD}{'='*60}{Colors.END}")
-    print_info("FalkorDB Cloud connection is fully functional via Redis protocol")
-    print_info("Connection details:")
-    print_info(f"  - Protocol: Redis RESP")
-    print_info(f"  - Host: {host}")
-    print_info(f"  - Port: {port}")
-    print_info(f"  - Library: falkordb-py 1.2.0")
-
-    return 0
+    _, graph_name, _ = falkordb
+    _, graphs_after = cleanup
+    assert graph_name not in graphs_after, "Graph still exists after deletion"
+    print_success("Graph successfully removed. Current graphs: %s", graphs_after)
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # Serial with -s so the diagnostic report reaches the terminal
+    sys.exit(pytest.main([__file__, "-v", "-s"]))